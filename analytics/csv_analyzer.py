@@ -7,16 +7,24 @@ Analyzes the all_bills.csv file to identify:
 - Data type inference for DB schema planning
 """
 
+import argparse
 import csv
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Any
 
 
 # Columns to ignore in main analysis (expanded horizontally)
 IGNORE_PATTERNS = ["Cosponsor"]  # billSubjectTerm now has useful data!
 
+# Read the CSV in large chunks; the file is scanned once front to back
+READ_BUFFER_SIZE = 1 << 20
+
+# Only primary_type is reported, so types are inferred from the first N
+# filled values of each column (use --full-type-scan to check every value)
+TYPE_SAMPLE_LIMIT = 256
+
 # ANSI colors for terminal output
 class Colors:
     GREEN = "\033[92m"
@@ -27,84 +35,118 @@ class Colors:
     END = "\033[0m"
 
 
+# Pre-rendered report fragments
+GREEN_BULLET = f"{Colors.GREEN}•{Colors.END}"
+YELLOW_BULLET = f"{Colors.YELLOW}•{Colors.END}"
+RED_BULLET = f"{Colors.RED}•{Colors.END}"
+RULE = "-" * 70
+BARS = ["█" * i for i in range(31)]  # subject-term histogram, indexed by bar length
+
+
 def should_ignore_column(col_name: str) -> bool:
     """Check if column should be ignored based on patterns."""
     return any(pattern in col_name for pattern in IGNORE_PATTERNS)
 
 
 def infer_type(value: str) -> str:
-    """Infer the data type of a value."""
-    if not value or value.strip() == "":
+    """Infer the data type of a value in a single pass over its characters."""
+    value = value.strip() if value else ""
+    if not value:
         return "empty"
     
-    value = value.strip()
-    
     # Check for URL
-    if value.startswith("http://") or value.startswith("https://"):
+    if value[0] == "h" and value.startswith(("http://", "https://")):
         return "url"
     
-    # Check for date patterns (MM/DD/YYYY or YYYY-MM-DD)
-    if "/" in value and len(value) == 10:
-        parts = value.split("/")
-        if len(parts) == 3 and all(p.isdigit() for p in parts):
+    # Classify the remaining characters; anything outside [0-9./] is a string
+    signed = value[0] in "+-"
+    digits = dots = slashes = 0
+    for ch in value[1:] if signed else value:
+        if "0" <= ch <= "9":
+            digits += 1
+        elif ch == ".":
+            dots += 1
+        elif ch == "/":
+            slashes += 1
+        else:
+            return "string"
+    
+    if not digits:
+        return "string"
+    
+    # Check for date patterns (MM/DD/YYYY)
+    if slashes:
+        if (
+            slashes == 2 and len(value) == 10 and not signed and not dots
+            and value[0] != "/" and value[-1] != "/" and "//" not in value
+        ):
             return "date"
+        return "string"
     
-    # Check for integer
-    try:
-        int(value)
+    if not dots:
         return "integer"
-    except ValueError:
-        pass
-    
-    # Check for float
-    try:
-        float(value)
+    if dots == 1:
         return "float"
-    except ValueError:
-        pass
     
     # Default to string
     return "string"
 
 
-def analyze_csv(filepath: str) -> dict[str, Any]:
-    """Analyze CSV file and return statistics."""
+def get_primary_type(types: dict[str, int]) -> str | None:
+    """Return the most common non-empty type, or None if the column has none."""
+    best_type = None
+    best_count = 0
+    for dtype, count in types.items():
+        if dtype != "empty" and count > best_count:
+            best_type, best_count = dtype, count
+    return best_type
+
+
+def analyze_csv(filepath: str, full_type_scan: bool = False) -> dict[str, Any]:
+    """Analyze CSV file and return statistics.
+    
+    Fill counts always cover every row; type counts cover the first
+    TYPE_SAMPLE_LIMIT filled values per column unless full_type_scan is set.
+    """
+    type_limit = sys.maxsize if full_type_scan else TYPE_SAMPLE_LIMIT
     
-    with open(filepath, "r", encoding="utf-8") as f:
+    with open(filepath, "r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE) as f:
         # Skip metadata rows (first 3 rows based on inspection)
         for _ in range(3):
             next(f)
         
-        # Read headers manually to track column indices
-        header_line = next(f)
-        all_headers = list(csv.reader([header_line]))[0]
+        # One reader parses the header and every data row
+        reader = csv.reader(f)
+        all_headers = next(reader)
         
         # Find indices of billSubjectTerm and Cosponsor columns
         subject_term_indices = [i for i, h in enumerate(all_headers) if h == "billSubjectTerm"]
         cosponsor_indices = [i for i, h in enumerate(all_headers) if h == "Cosponsor"]
         
-        # Get unique headers for main analysis (excluding repeated columns)
+        # Resolve ignored columns once per header position
+        ignored_mask = [h == "billSubjectTerm" or should_ignore_column(h) for h in all_headers]
+        
+        # Get unique headers for main analysis (excluding repeated columns),
+        # mapped to the index of their first occurrence
         seen = set()
         relevant_headers = []
-        for h in all_headers:
-            if h not in seen and h != "billSubjectTerm" and not should_ignore_column(h):
+        col_indices: list[tuple[str, int]] = []
+        for i, h in enumerate(all_headers):
+            if not ignored_mask[i] and h not in seen:
                 seen.add(h)
                 relevant_headers.append(h)
+                col_indices.append((h, i))
         
-        # Initialize counters
-        stats = {
-            col: {
-                "total": 0,
-                "filled": 0,
-                "empty": 0,
-                "types": defaultdict(int),
-                "sample_values": [],
-            }
-            for col in relevant_headers
-        }
+        # Column-major counters, one slot per entry in col_indices.
+        # Totals and empty counts are derived from total_rows afterwards.
+        src_indices = [i for _, i in col_indices]
+        filled_counts = [0] * len(col_indices)
+        type_counts = [defaultdict(int) for _ in col_indices]
+        sample_values: list[list[str]] = [[] for _ in col_indices]
+        sample_sets: list[set[str]] = [set() for _ in col_indices]
         
         # Track billSubjectTerms separately
-        subject_term_counts: dict[str, int] = defaultdict(int)
+        subject_term_counts: Counter[str] = Counter()
         bills_with_subject_terms = 0
         
         # Track cosponsor stats
@@ -113,61 +155,92 @@ def analyze_csv(filepath: str) -> dict[str, Any]:
         
         total_rows = 0
         
-        reader = csv.reader(f)
+        # Column slots whose sample list already holds 3 entries
+        full_samples: set[int] = set()
+        
+        # Slots with full samples and TYPE_SAMPLE_LIMIT inferred types; once
+        # every slot is saturated only fill counts remain to be tracked
+        saturated: set[int] = set()
+        num_slots = len(src_indices)
+        
         for row_values in reader:
             total_rows += 1
             
+            # Strip every cell once; all checks below reuse these values
+            stripped = [v.strip() if v else "" for v in row_values]
+            row_len = len(stripped)
+            
             # Extract subject terms from their specific columns
-            row_subject_terms = []
-            for idx in subject_term_indices:
-                if idx < len(row_values) and row_values[idx] and row_values[idx].strip():
-                    term = row_values[idx].strip()
-                    row_subject_terms.append(term)
-                    subject_term_counts[term] += 1
+            row_subject_terms = [
+                stripped[idx] for idx in subject_term_indices if idx < row_len and stripped[idx]
+            ]
             
             if row_subject_terms:
                 bills_with_subject_terms += 1
+                subject_term_counts.update(row_subject_terms)
             
             # Extract cosponsor count
             row_cosponsors = 0
             for idx in cosponsor_indices:
-                if idx < len(row_values) and row_values[idx] and row_values[idx].strip():
+                if idx < row_len and stripped[idx]:
                     row_cosponsors += 1
             
             if row_cosponsors > 0:
                 bills_with_cosponsors += 1
                 total_cosponsors += row_cosponsors
             
-            # Create a dict for this row using unique headers
-            row_dict = {}
-            for i, h in enumerate(all_headers):
-                if h in relevant_headers and h not in row_dict:
-                    row_dict[h] = row_values[i] if i < len(row_values) else ""
+            if len(saturated) == num_slots:
+                # Count-only fast path
+                for j, i in enumerate(src_indices):
+                    if i < row_len and stripped[i]:
+                        filled_counts[j] += 1
+                continue
             
-            for col in relevant_headers:
-                value = row_dict.get(col, "")
-                stats[col]["total"] += 1
+            for j, i in enumerate(src_indices):
+                value = stripped[i] if i < row_len else ""
+                if not value:
+                    continue
                 
-                if value and value.strip():
-                    stats[col]["filled"] += 1
-                    dtype = infer_type(value)
-                    stats[col]["types"][dtype] += 1
-                    
-                    # Store sample values (max 3)
-                    if len(stats[col]["sample_values"]) < 3:
-                        # Truncate long values
-                        sample = value[:80] + "..." if len(value) > 80 else value
-                        if sample not in stats[col]["sample_values"]:
-                            stats[col]["sample_values"].append(sample)
-                else:
-                    stats[col]["empty"] += 1
-                    stats[col]["types"]["empty"] += 1
+                filled_counts[j] += 1
+                if filled_counts[j] <= type_limit:
+                    type_counts[j][infer_type(value)] += 1
+                    if filled_counts[j] == type_limit and j in full_samples:
+                        saturated.add(j)
+                
+                # Store sample values (max 3)
+                if j not in full_samples:
+                    # Truncate long values
+                    sample = value[:80] + "..." if len(value) > 80 else value
+                    seen_samples = sample_sets[j]
+                    if sample not in seen_samples:
+                        seen_samples.add(sample)
+                        sample_values[j].append(sample)
+                        if len(seen_samples) == 3:
+                            full_samples.add(j)
+                            if filled_counts[j] >= type_limit:
+                                saturated.add(j)
+    
+    stats = {}
+    for j, (col, _) in enumerate(col_indices):
+        empty = total_rows - filled_counts[j]
+        types = type_counts[j]
+        if empty:
+            types["empty"] += empty
+        stats[col] = {
+            "total": total_rows,
+            "filled": filled_counts[j],
+            "empty": empty,
+            "types": types,
+            "sample_values": sample_values[j],
+            "fill_rate": filled_counts[j] / total_rows * 100 if total_rows > 0 else 0,
+            "primary_type": get_primary_type(types),
+        }
     
     return {
         "total_rows": total_rows,
         "columns": stats,
         "relevant_headers": relevant_headers,
-        "subject_terms": dict(subject_term_counts),
+        "subject_terms": subject_term_counts,
         "bills_with_subject_terms": bills_with_subject_terms,
         "cosponsor_stats": {
             "bills_with_cosponsors": bills_with_cosponsors,
@@ -180,15 +253,19 @@ def analyze_csv(filepath: str) -> dict[str, Any]:
 def print_report(analysis: dict[str, Any]) -> None:
     """Print formatted analysis report."""
     
+    # Collect the report and write it to stdout in one call
+    lines: list[str] = []
+    emit = lines.append
+    
     total_rows = analysis["total_rows"]
     columns = analysis["columns"]
     
-    print(f"\n{Colors.BOLD}{'='*70}")
-    print(f"  CSV DATA ANALYSIS REPORT")
-    print(f"{'='*70}{Colors.END}\n")
+    emit(f"\n{Colors.BOLD}{'='*70}")
+    emit(f"  CSV DATA ANALYSIS REPORT")
+    emit(f"{'='*70}{Colors.END}\n")
     
-    print(f"{Colors.CYAN}Total Rows:{Colors.END} {total_rows:,}")
-    print(f"{Colors.CYAN}Analyzed Columns:{Colors.END} {len(columns)} (excluding billSubjectTerm columns)\n")
+    emit(f"{Colors.CYAN}Total Rows:{Colors.END} {total_rows:,}")
+    emit(f"{Colors.CYAN}Analyzed Columns:{Colors.END} {len(columns)} (excluding billSubjectTerm columns)\n")
     
     # Categorize columns by fill rate
     always_filled = []
@@ -197,111 +274,104 @@ def print_report(analysis: dict[str, Any]) -> None:
     rarely_filled = []
     
     for col, stats in columns.items():
-        fill_rate = (stats["filled"] / stats["total"]) * 100 if stats["total"] > 0 else 0
+        fill_rate = stats["fill_rate"]
         
         if fill_rate == 100:
-            always_filled.append((col, stats, fill_rate))
+            always_filled.append((col, stats))
         elif fill_rate >= 90:
-            mostly_filled.append((col, stats, fill_rate))
+            mostly_filled.append((col, stats))
         elif fill_rate >= 50:
-            sometimes_filled.append((col, stats, fill_rate))
+            sometimes_filled.append((col, stats))
         else:
-            rarely_filled.append((col, stats, fill_rate))
+            rarely_filled.append((col, stats))
     
     # Print Always Filled (100%) - Safe for NOT NULL
-    print(f"\n{Colors.GREEN}{Colors.BOLD}✅ ALWAYS FILLED (100%) - Safe for NOT NULL{Colors.END}")
-    print("-" * 70)
+    emit(f"\n{Colors.GREEN}{Colors.BOLD}✅ ALWAYS FILLED (100%) - Safe for NOT NULL{Colors.END}")
+    emit(RULE)
     if always_filled:
-        for col, stats, fill_rate in always_filled:
-            primary_type = max(stats["types"].items(), key=lambda x: x[1] if x[0] != "empty" else 0)[0]
-            print(f"  {Colors.GREEN}•{Colors.END} {col}")
-            print(f"    Type: {Colors.CYAN}{primary_type}{Colors.END}")
+        for col, stats in always_filled:
+            emit(f"  {GREEN_BULLET} {col}")
+            emit(f"    Type: {Colors.CYAN}{stats['primary_type']}{Colors.END}")
             if stats["sample_values"]:
-                print(f"    Sample: {stats['sample_values'][0][:60]}")
+                emit(f"    Sample: {stats['sample_values'][0][:60]}")
     else:
-        print("  (none)")
+        emit("  (none)")
     
     # Print Mostly Filled (90-99%)
-    print(f"\n{Colors.YELLOW}{Colors.BOLD}⚠️  MOSTLY FILLED (90-99%) - Consider NULLABLE{Colors.END}")
-    print("-" * 70)
+    emit(f"\n{Colors.YELLOW}{Colors.BOLD}⚠️  MOSTLY FILLED (90-99%) - Consider NULLABLE{Colors.END}")
+    emit(RULE)
     if mostly_filled:
-        for col, stats, fill_rate in mostly_filled:
-            primary_type = max(stats["types"].items(), key=lambda x: x[1] if x[0] != "empty" else 0)[0]
-            print(f"  {Colors.YELLOW}•{Colors.END} {col}")
-            print(f"    Fill Rate: {fill_rate:.1f}% ({stats['empty']:,} missing)")
-            print(f"    Type: {Colors.CYAN}{primary_type}{Colors.END}")
+        for col, stats in mostly_filled:
+            emit(f"  {YELLOW_BULLET} {col}")
+            emit(f"    Fill Rate: {stats['fill_rate']:.1f}% ({stats['empty']:,} missing)")
+            emit(f"    Type: {Colors.CYAN}{stats['primary_type']}{Colors.END}")
     else:
-        print("  (none)")
+        emit("  (none)")
     
     # Print Sometimes Filled (50-89%)
-    print(f"\n{Colors.YELLOW}{Colors.BOLD}📊 SOMETIMES FILLED (50-89%) - NULLABLE{Colors.END}")
-    print("-" * 70)
+    emit(f"\n{Colors.YELLOW}{Colors.BOLD}📊 SOMETIMES FILLED (50-89%) - NULLABLE{Colors.END}")
+    emit(RULE)
     if sometimes_filled:
-        for col, stats, fill_rate in sometimes_filled:
-            primary_type = max(stats["types"].items(), key=lambda x: x[1] if x[0] != "empty" else 0)[0]
-            print(f"  {Colors.YELLOW}•{Colors.END} {col}")
-            print(f"    Fill Rate: {fill_rate:.1f}% ({stats['empty']:,} missing)")
-            print(f"    Type: {Colors.CYAN}{primary_type}{Colors.END}")
+        for col, stats in sometimes_filled:
+            emit(f"  {YELLOW_BULLET} {col}")
+            emit(f"    Fill Rate: {stats['fill_rate']:.1f}% ({stats['empty']:,} missing)")
+            emit(f"    Type: {Colors.CYAN}{stats['primary_type']}{Colors.END}")
     else:
-        print("  (none)")
+        emit("  (none)")
     
     # Print Rarely Filled (<50%)
-    print(f"\n{Colors.RED}{Colors.BOLD}❌ RARELY FILLED (<50%) - Optional/NULLABLE{Colors.END}")
-    print("-" * 70)
+    emit(f"\n{Colors.RED}{Colors.BOLD}❌ RARELY FILLED (<50%) - Optional/NULLABLE{Colors.END}")
+    emit(RULE)
     if rarely_filled:
-        for col, stats, fill_rate in rarely_filled:
-            primary_type = "N/A"
-            non_empty_types = {k: v for k, v in stats["types"].items() if k != "empty"}
-            if non_empty_types:
-                primary_type = max(non_empty_types.items(), key=lambda x: x[1])[0]
-            print(f"  {Colors.RED}•{Colors.END} {col}")
-            print(f"    Fill Rate: {fill_rate:.1f}% ({stats['filled']:,} filled, {stats['empty']:,} missing)")
-            print(f"    Type: {Colors.CYAN}{primary_type}{Colors.END}")
+        for col, stats in rarely_filled:
+            primary_type = stats["primary_type"] or "N/A"
+            emit(f"  {RED_BULLET} {col}")
+            emit(f"    Fill Rate: {stats['fill_rate']:.1f}% ({stats['filled']:,} filled, {stats['empty']:,} missing)")
+            emit(f"    Type: {Colors.CYAN}{primary_type}{Colors.END}")
     else:
-        print("  (none)")
+        emit("  (none)")
     
     # Print Cosponsor Analysis
     cosponsor_stats = analysis.get("cosponsor_stats", {})
     if cosponsor_stats:
-        print(f"\n{Colors.CYAN}{Colors.BOLD}👥 COSPONSOR ANALYSIS{Colors.END}")
-        print("-" * 70)
-        print(f"  Bills with cosponsors: {cosponsor_stats['bills_with_cosponsors']:,} / {total_rows:,} ({cosponsor_stats['bills_with_cosponsors']/total_rows*100:.1f}%)")
-        print(f"  Total cosponsors: {cosponsor_stats['total_cosponsors']:,}")
-        print(f"  Avg cosponsors per bill: {cosponsor_stats['avg_per_bill']:.1f}")
+        emit(f"\n{Colors.CYAN}{Colors.BOLD}👥 COSPONSOR ANALYSIS{Colors.END}")
+        emit(RULE)
+        emit(f"  Bills with cosponsors: {cosponsor_stats['bills_with_cosponsors']:,} / {total_rows:,} ({cosponsor_stats['bills_with_cosponsors']/total_rows*100:.1f}%)")
+        emit(f"  Total cosponsors: {cosponsor_stats['total_cosponsors']:,}")
+        emit(f"  Avg cosponsors per bill: {cosponsor_stats['avg_per_bill']:.1f}")
     
     # Print billSubjectTerm Analysis
-    subject_terms = analysis.get("subject_terms", {})
+    subject_terms: Counter[str] = analysis.get("subject_terms", Counter())
     bills_with_terms = analysis.get("bills_with_subject_terms", 0)
     
-    print(f"\n{Colors.CYAN}{Colors.BOLD}🏷️  BILL SUBJECT TERMS ANALYSIS{Colors.END}")
-    print("-" * 70)
-    print(f"  Bills with subject terms: {bills_with_terms:,} / {total_rows:,} ({bills_with_terms/total_rows*100:.1f}%)")
-    print(f"  Unique subject terms: {len(subject_terms):,}")
+    emit(f"\n{Colors.CYAN}{Colors.BOLD}🏷️  BILL SUBJECT TERMS ANALYSIS{Colors.END}")
+    emit(RULE)
+    emit(f"  Bills with subject terms: {bills_with_terms:,} / {total_rows:,} ({bills_with_terms/total_rows*100:.1f}%)")
+    emit(f"  Unique subject terms: {len(subject_terms):,}")
     
     if subject_terms:
-        # Sort by frequency
-        sorted_terms = sorted(subject_terms.items(), key=lambda x: x[1], reverse=True)
-        print(f"\n  {Colors.BOLD}Top 30 Subject Terms:{Colors.END}")
-        for term, count in sorted_terms[:30]:
+        # Only the top 30 by frequency are shown
+        sorted_terms = subject_terms.most_common(30)
+        emit(f"\n  {Colors.BOLD}Top 30 Subject Terms:{Colors.END}")
+        for term, count in sorted_terms:
             bar_len = int((count / sorted_terms[0][1]) * 30)
-            bar = "█" * bar_len
-            print(f"    {count:>4} {bar} {term}")
+            emit(f"    {count:>4} {BARS[bar_len]} {term}")
         
-        if len(sorted_terms) > 30:
-            print(f"\n    ... and {len(sorted_terms) - 30} more terms")
+        if len(subject_terms) > 30:
+            emit(f"\n    ... and {len(subject_terms) - 30} more terms")
     
     # Print DB Schema Recommendation
-    print(f"\n{Colors.BOLD}{'='*70}")
-    print(f"  RECOMMENDED DB SCHEMA (based on analysis)")
-    print(f"{'='*70}{Colors.END}\n")
+    emit(f"\n{Colors.BOLD}{'='*70}")
+    emit(f"  RECOMMENDED DB SCHEMA (based on analysis)")
+    emit(f"{'='*70}{Colors.END}\n")
     
-    print("```sql")
-    print("CREATE TABLE bills (")
-    print("  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),")
+    emit("```sql")
+    emit("CREATE TABLE bills (")
+    emit("  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),")
     
-    for col, stats, fill_rate in always_filled:
+    for col, stats in always_filled:
         col_name = col.lower().replace(" ", "_").replace("-", "_")
-        primary_type = max(stats["types"].items(), key=lambda x: x[1] if x[0] != "empty" else 0)[0]
+        primary_type = stats["primary_type"]
         sql_type = "TEXT"
         if primary_type == "date":
             sql_type = "DATE"
@@ -309,12 +379,11 @@ def print_report(analysis: dict[str, Any]) -> None:
             sql_type = "TEXT"
         elif primary_type == "integer":
             sql_type = "INTEGER"
-        print(f"  {col_name} {sql_type} NOT NULL,")
+        emit(f"  {col_name} {sql_type} NOT NULL,")
     
-    for col, stats, fill_rate in mostly_filled + sometimes_filled + rarely_filled:
+    for col, stats in mostly_filled + sometimes_filled + rarely_filled:
         col_name = col.lower().replace(" ", "_").replace("-", "_")
-        non_empty_types = {k: v for k, v in stats["types"].items() if k != "empty"}
-        primary_type = max(non_empty_types.items(), key=lambda x: x[1])[0] if non_empty_types else "string"
+        primary_type = stats["primary_type"] or "string"
         sql_type = "TEXT"
         if primary_type == "date":
             sql_type = "DATE"
@@ -322,33 +391,44 @@ def print_report(analysis: dict[str, Any]) -> None:
             sql_type = "TEXT"
         elif primary_type == "integer":
             sql_type = "INTEGER"
-        print(f"  {col_name} {sql_type},  -- {fill_rate:.0f}% filled")
+        emit(f"  {col_name} {sql_type},  -- {stats['fill_rate']:.0f}% filled")
+    
+    emit("  created_at TIMESTAMPTZ DEFAULT NOW()")
+    emit(");")
+    emit("```")
     
-    print("  created_at TIMESTAMPTZ DEFAULT NOW()")
-    print(");")
-    print("```")
+    emit(f"\n{Colors.BOLD}{'='*70}{Colors.END}\n")
     
-    print(f"\n{Colors.BOLD}{'='*70}{Colors.END}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     # Default to all_bills.csv in parent directory
     default_path = Path(__file__).parent.parent / "all_bills.csv"
     
-    if len(sys.argv) > 1:
-        filepath = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Analyze a bills CSV export for DB schema planning.")
+    parser.add_argument("filepath", nargs="?", help="CSV file to analyze (defaults to all_bills.csv)")
+    parser.add_argument(
+        "--full-type-scan",
+        action="store_true",
+        help=f"infer types from every value instead of the first {TYPE_SAMPLE_LIMIT} per column",
+    )
+    args = parser.parse_args()
+    
+    if args.filepath:
+        filepath = args.filepath
     elif default_path.exists():
         filepath = str(default_path)
     else:
         print(f"{Colors.RED}Error: No CSV file specified and default not found.{Colors.END}")
-        print(f"Usage: python csv_analyzer.py [path/to/file.csv]")
+        print(f"Usage: python csv_analyzer.py [--full-type-scan] [path/to/file.csv]")
         sys.exit(1)
     
     print(f"\n{Colors.CYAN}Analyzing:{Colors.END} {filepath}")
     print(f"{Colors.CYAN}Please wait...{Colors.END}")
     
     try:
-        analysis = analyze_csv(filepath)
+        analysis = analyze_csv(filepath, full_type_scan=args.full_type_scan)
         print_report(analysis)
     except FileNotFoundError:
         print(f"{Colors.RED}Error: File not found: {filepath}{Colors.END}")